@@ -1,9 +1,14 @@
 import streamlit as st
+import re
+import hashlib
 from datetime import datetime, timedelta
 from typing import List
+from io import BytesIO
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 import pandas as pd
 import pdfplumber
-import tempfile
+import pypdfium2 as pdfium
 import os
 from fpdf import FPDF
 
@@ -15,7 +20,7 @@ st.set_page_config(
 )
 
 # Custom CSS for modern blue theme
-st.markdown("""
+_THEME_CSS = """
 <style>
     /* Main page styling */
     .main {
@@ -110,211 +115,267 @@ st.markdown("""
         border-color: #1a237e transparent transparent transparent !important;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+st.markdown(_THEME_CSS, unsafe_allow_html=True)
 
-class Document:
-    def __init__(self, id: str, date: str, vendor: str, amount: float, gst: float, type: str):
-        self.id = id
-        self.date = date
-        self.vendor = vendor
-        self.amount = amount
-        self.gst = gst
-        self.type = type
+# Columns of the transactions DataFrame shared by all input methods
+DOCUMENT_COLUMNS = ['id', 'date', 'vendor', 'amount', 'gst', 'type']
+DATE_FORMAT = "%Y-%m-%d"
 
-def extract_data_from_pdf(pdf_file):
-    """Extract data from uploaded PDF invoices"""
-    documents = []
-    with pdfplumber.open(pdf_file) as pdf:
-        for page in pdf.pages:
-            text = page.extract_text()
-            lines = text.split('\n')
-            vendor = "Unknown"
-            date = datetime.now().strftime("%Y-%m-%d")
-            amount = 0.0
-            gst = 0.0
-            doc_id = "PDF-" + str(hash(text) % 1000000)
-            
-            for line in lines:
-                if "Vendor:" in line:
-                    vendor = line.replace("Vendor:", "").strip()
-                elif "Date:" in line:
-                    date = line.replace("Date:", "").strip()
-                elif "Total:" in line:
-                    amount = float(line.replace("Total:", "").replace("₹", "").replace(",", "").strip())
-                elif "GST:" in line:
-                    gst = float(line.replace("GST:", "").replace("₹", "").replace(",", "").strip())
+# Labelled invoice fields and the currency formatting stripped from amounts
+_FIELD_RE = re.compile(r'(?m)^[ \t]*(Vendor|Date|Total|GST):[ \t]*(.+?)[ \t]*$')
+_NUM_CLEAN = re.compile(r'[₹,\s]')
+
+def apply_document_dtypes(df):
+    """Cast transaction columns to the dtypes used by the report"""
+    return df.astype({'type': 'category', 'vendor': 'string[pyarrow]', 'id': 'string[pyarrow]'})
+
+def _iter_pdf_page_texts(file_bytes: bytes):
+    """Yield the text of each PDF page, falling back to pdfplumber for pages pdfium reads as empty"""
+    pdf = pdfium.PdfDocument(file_bytes)
+    plumber_pdf = None
+    try:
+        for index in range(len(pdf)):
+            page = pdf[index]
+            textpage = page.get_textpage()
+            try:
+                text = textpage.get_text_range().replace('\r\n', '\n')
+            finally:
+                textpage.close()
+                page.close()
             
-            doc_type = "expense" if "Invoice" in text else "income"
-            documents.append(Document(doc_id, date, vendor, amount, gst, doc_type))
-    return documents
+            if not text.strip():
+                # Only plain text is needed, so skip pdfminer's layout analysis.
+                # One document per file shares its caching resource manager across
+                # pages; pdfminer keys cached fonts by object id, so it must not be
+                # shared between files.
+                if plumber_pdf is None:
+                    plumber_pdf = pdfplumber.open(BytesIO(file_bytes), laparams=None)
+                plumber_page = plumber_pdf.pages[index]
+                try:
+                    text = plumber_page.extract_text()
+                finally:
+                    # Drop the page's cached layout objects before moving on
+                    plumber_page.close()
+            yield text
+    finally:
+        if plumber_pdf is not None:
+            plumber_pdf.close()
+        pdf.close()
+
+def extract_data_from_pdf(file_bytes: bytes, today: str):
+    """Extract data from uploaded PDF invoices, dating pages without a Date line as today"""
+    rows = []
+    for text in _iter_pdf_page_texts(file_bytes):
+        # Content digest gives IDs that are stable across runs, unlike hash()
+        doc_id = "PDF-" + hashlib.blake2b(text.encode('utf-8', 'ignore'), digest_size=6).hexdigest()
+        
+        # Stop scanning once every label is found; invoices put them in the header
+        fields = {}
+        for match in _FIELD_RE.finditer(text):
+            fields[match.group(1)] = match.group(2)
+            if len(fields) == 4:
+                break
+        vendor = fields.get('Vendor', "Unknown")
+        date = fields.get('Date', today)
+        amount = float(_NUM_CLEAN.sub('', fields.get('Total', '0')))
+        gst = float(_NUM_CLEAN.sub('', fields.get('GST', '0')))
+        
+        doc_type = "expense" if "Invoice" in text else "income"
+        rows.append((doc_id, date, vendor, amount, gst, doc_type))
+    df = pd.DataFrame(rows, columns=DOCUMENT_COLUMNS)
+    df['date'] = pd.to_datetime(df['date'], format=DATE_FORMAT, errors='coerce')
+    return apply_document_dtypes(df)
+
+def extract_data_from_csv(file_bytes: bytes, today: str):
+    """Extract data from uploaded CSV file, dating it as today if it has no date column"""
+    df = pd.read_csv(BytesIO(file_bytes))
+    df = df.rename(columns=str.lower)
+    
+    # Normalise columns in bulk instead of row by row
+    missing = pd.Series(index=df.index, dtype=object)
+    fallback_ids = "CSV-" + df.index.astype(str)
+    df['id'] = df.get('id', df.get('invoice_no', missing)).fillna(pd.Series(fallback_ids, index=df.index)).astype(str)
+    # Default to today only when the column is absent; blank cells stay NaT and are filtered out
+    if 'date' in df:
+        df['date'] = pd.to_datetime(df['date'].astype(str), format=DATE_FORMAT, errors='coerce')
+    else:
+        df['date'] = pd.Timestamp(today)
+    df['vendor'] = df.get('vendor', missing).fillna('Unknown').astype(str)
+    zeros = pd.Series(0.0, index=df.index)
+    df['amount'] = pd.to_numeric(df.get('amount', zeros), errors='coerce').fillna(0).astype(float)
+    df['gst'] = pd.to_numeric(df.get('gst', zeros), errors='coerce').fillna(0).astype(float)
+    df['type'] = df.get('type', missing).fillna('expense').astype(str).str.lower()
+    
+    return apply_document_dtypes(df[DOCUMENT_COLUMNS])
+
+def _extract_upload(file_name: str, file_bytes: bytes, today: str):
+    """Dispatch one uploaded file to its parser"""
+    if file_name.lower().endswith('.pdf'):
+        return extract_data_from_pdf(file_bytes, today)
+    elif file_name.lower().endswith('.csv'):
+        return extract_data_from_csv(file_bytes, today)
+    return None
+
+# today is part of the cache key so cached frames never carry a stale default date
+# Workers must not be forked from the multi-threaded Streamlit server, so fork them
+# from a clean forkserver process instead (spawn where that is unavailable)
+_WORKER_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
 
-def extract_data_from_csv(csv_file):
-    """Extract data from uploaded CSV file"""
-    df = pd.read_csv(csv_file)
-    documents = []
-    for _, row in df.iterrows():
+@st.cache_data(show_spinner=False, ttl="1d", max_entries=32)
+def extract_data_from_uploads(uploads, today: str):
+    """Parse (name, bytes) uploads, in parallel when there are several (cached on the file contents)"""
+    frames = []
+    
+    def collect(file_name, parse):
         try:
-            doc = Document(
-                id=str(row.get('id', row.get('invoice_no', f"CSV-{_}"))),
-                date=str(row.get('date', datetime.now().strftime("%Y-%m-%d"))),
-                vendor=str(row.get('vendor', 'Unknown')),
-                amount=float(row.get('amount', 0)),
-                gst=float(row.get('gst', 0)),
-                type=str(row.get('type', 'expense')).lower()
-            )
-            documents.append(doc)
+            df = parse()
+            if df is not None:
+                frames.append(df)
         except Exception as e:
-            st.warning(f"Skipping row {_}: {e}")
-    return documents
+            st.error(f"Error processing {file_name}: {e}")
+    
+    if len(uploads) == 1:
+        # A lone file is parsed inline; forking the server process for one task is pure overhead
+        file_name, file_bytes = uploads[0]
+        collect(file_name, lambda: _extract_upload(file_name, file_bytes, today))
+    else:
+        with ProcessPoolExecutor(max_workers=min(len(uploads), os.cpu_count() or 1),
+                                 mp_context=_WORKER_CONTEXT) as executor:
+            futures = [(name, executor.submit(_extract_upload, name, data, today)) for name, data in uploads]
+            for file_name, future in futures:
+                collect(file_name, future.result)
+    return frames
 
-def create_pdf(report_text, business_name, start_date, end_date):
-    """Create a PDF version of the report with proper encoding"""
-    # Clean text for PDF compatibility
-    def clean_text(text):
-        # Replace emojis and special characters
-        replacements = {
-            '📊': '[REPORT]', '📅': '[DATE]', '📌': '[SUMMARY]',
-            '📈': '[ANALYSIS]', '🧾': '[GST]', '🤖': '[AI]',
-            '✅': '[CHECK]', '₹': 'Rs.', '‘': "'", '’': "'",
-            '“': '"', '”': '"', '–': '-', '—': '-', '…': '...'
-        }
-        for k, v in replacements.items():
-            text = text.replace(k, v)
-        return text.encode('latin-1', 'replace').decode('latin-1')
+# Unicode TTF font for the PDF report, shipped alongside this script
+PDF_FONT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fonts")
 
+def create_pdf(report_text, business_name, start_date, end_date):
+    """Create a PDF version of the report with a Unicode font"""
     pdf = FPDF()
+    pdf.add_font("DejaVu", '', os.path.join(PDF_FONT_DIR, "DejaVuSans.ttf"))
+    pdf.add_font("DejaVu", 'B', os.path.join(PDF_FONT_DIR, "DejaVuSans-Bold.ttf"))
     pdf.add_page()
-    pdf.set_font("Arial", size=12)
     
     # Add title
-    pdf.set_font("Arial", 'B', 16)
-    pdf.cell(200, 10, txt=clean_text(f"{business_name} - Audit Report"), ln=1, align='C')
-    pdf.set_font("Arial", '', 12)
-    pdf.cell(200, 10, txt=clean_text(f"Period: {start_date} to {end_date}"), ln=1, align='C')
+    pdf.set_font("DejaVu", 'B', 16)
+    pdf.cell(200, 10, text=f"{business_name} - Audit Report", new_x="LMARGIN", new_y="NEXT", align='C')
+    pdf.set_font("DejaVu", '', 12)
+    pdf.cell(200, 10, text=f"Period: {start_date} to {end_date}", new_x="LMARGIN", new_y="NEXT", align='C')
     pdf.ln(10)
     
     # Process each section
     sections = report_text.split('## ')
     for section in sections[1:]:
-        title = clean_text(section.split('\n')[0])
-        content = '\n'.join([clean_text(line) for line in section.split('\n')[1:]])
+        title, _, content = section.partition('\n')
         
-        pdf.set_font("Arial", 'B', 14)
-        pdf.cell(200, 10, txt=title, ln=1)
-        pdf.set_font("Arial", '', 12)
+        pdf.set_font("DejaVu", 'B', 14)
+        pdf.cell(200, 10, text=title, new_x="LMARGIN", new_y="NEXT")
+        pdf.set_font("DejaVu", '', 12)
         
         for line in content.split('\n'):
             if line.strip():
-                pdf.multi_cell(0, 8, txt=line.strip())
+                pdf.multi_cell(0, 8, text=line.strip(), new_x="LMARGIN", new_y="NEXT")
         pdf.ln(5)
     
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-    pdf_path = temp_file.name
-    pdf.output(pdf_path)
-    return pdf_path
+    # Render in memory; the bytes go straight to the download button
+    return bytes(pdf.output())
 
-def generate_audit_report(business_name, start_date, end_date, documents, risk_flags):
+def generate_audit_report(business_name, start_date, end_date, df, risk_flags):
     """Generate comprehensive audit report with text icons for PDF"""
     # Filter documents by date range
-    filtered_docs = []
-    for doc in documents:
-        try:
-            doc_date = datetime.strptime(doc.date, "%Y-%m-%d").date()
-            if start_date <= doc_date <= end_date:
-                filtered_docs.append(doc)
-        except:
-            continue
+    df = df[df['date'].between(pd.Timestamp(start_date), pd.Timestamp(end_date))]
     
     # Calculate financials
-    df = pd.DataFrame([vars(d) for d in filtered_docs])
-    total_invoices = len(filtered_docs)
-    total_income = df[df['type'] == 'income']['amount'].sum()
-    total_expense = df[df['type'] == 'expense']['amount'].sum()
+    total_invoices = len(df)
+    income_df = df[df['type'] == 'income']
+    expense_df = df[df['type'] == 'expense']
+    totals = df.groupby('type', observed=True)['amount'].sum()
+    total_income = totals.get('income', 0.0)
+    total_expense = totals.get('expense', 0.0)
     net_balance = total_income - total_expense
     expense_ratio = (total_expense / total_income) * 100 if total_income > 0 else 0
     profit_margin = ((total_income - total_expense) / total_income * 100) if total_income > 0 else 0
     duration_days = (end_date - start_date).days + 1
     
     # 1. Executive Summary (using text icons)
-    report = f"# {business_name} - Audit Report\n"
-    report += f"## Period: {start_date} to {end_date} ({duration_days} days)\n\n"
-    report += "## Executive Summary\n\n"
-    report += f"- **Financial Overview**: Net balance of Rs.{net_balance:,.2f} "
-    report += f"(Income: Rs.{total_income:,.2f}, Expenses: Rs.{total_expense:,.2f})\n"
-    report += f"- **Profit Margin**: {profit_margin:.1f}%\n"
-    report += f"- **Expense Ratio**: {expense_ratio:.1f}% of income\n"
-    report += f"- **Transactions Processed**: {total_invoices}\n\n"
+    parts = [f"# {business_name} - Audit Report\n"]
+    parts.append(f"## Period: {start_date} to {end_date} ({duration_days} days)\n\n")
+    parts.append("## Executive Summary\n\n")
+    parts.append(f"- **Financial Overview**: Net balance of Rs.{net_balance:,.2f} ")
+    parts.append(f"(Income: Rs.{total_income:,.2f}, Expenses: Rs.{total_expense:,.2f})\n")
+    parts.append(f"- **Profit Margin**: {profit_margin:.1f}%\n")
+    parts.append(f"- **Expense Ratio**: {expense_ratio:.1f}% of income\n")
+    parts.append(f"- **Transactions Processed**: {total_invoices}\n\n")
     
     # 2. Cash Flow Analysis
-    report += "## Cash Flow Analysis\n\n"
+    parts.append("## Cash Flow Analysis\n\n")
     
     if not df.empty:
         # Income breakdown
-        income_df = df[df['type'] == 'income']
         if not income_df.empty:
-            report += "### Income Sources\n"
+            parts.append("### Income Sources\n")
             top_income = income_df.groupby('vendor')['amount'].sum().nlargest(3)
-            for vendor, amount in top_income.items():
-                report += f"- {vendor}: Rs.{amount:,.2f}\n"
+            parts.extend(f"- {vendor}: Rs.{amount:,.2f}\n" for vendor, amount in top_income.items())
         
         # Expense breakdown
-        expense_df = df[df['type'] == 'expense']
         if not expense_df.empty:
-            report += "\n### Major Expenses\n"
+            parts.append("\n### Major Expenses\n")
             top_expenses = expense_df.groupby('vendor')['amount'].sum().nlargest(3)
-            for vendor, amount in top_expenses.items():
-                report += f"- {vendor}: Rs.{amount:,.2f}\n"
+            parts.extend(f"- {vendor}: Rs.{amount:,.2f}\n" for vendor, amount in top_expenses.items())
     
     # 3. GST Compliance
-    report += "\n## GST Compliance\n\n"
-    gst_docs = [doc for doc in filtered_docs if doc.gst > 0]
-    if gst_docs:
-        total_gst = sum(doc.gst for doc in gst_docs)
-        report += f"- **Total GST Processed**: Rs.{total_gst:,.2f}\n"
+    parts.append("\n## GST Compliance\n\n")
+    gst_df = df[df['gst'] > 0]
+    if not gst_df.empty:
+        total_gst = gst_df['gst'].sum()
+        parts.append(f"- **Total GST Processed**: Rs.{total_gst:,.2f}\n")
         
-        # Check for GST issues
-        gst_issues = []
-        for doc in gst_docs:
-            if not any(x in doc.id.upper() for x in ['GST', 'INV', 'BILL']):
-                gst_issues.append(f"Invalid document ID: {doc.id}")
-            if doc.gst > doc.amount * 0.3:
-                gst_issues.append(f"Unusual GST amount: Rs.{doc.gst} on Rs.{doc.amount}")
+        # Check for GST issues, formatting only the first few of each kind
+        bad_id = ~gst_df['id'].str.contains(r'GST|INV|BILL', case=False, regex=True, na=False)
+        unusual = gst_df[gst_df['gst'] > gst_df['amount'] * 0.3].head(3)
+        gst_issues = pd.concat([
+            gst_df.loc[bad_id, 'id'].head(3).map("Invalid document ID: {}".format),
+            "Unusual GST amount: Rs." + unusual['gst'].astype(str) + " on Rs." + unusual['amount'].astype(str)
+        ]).sort_index(kind='stable')
         
-        if gst_issues:
-            report += "\n### GST Issues\n"
-            for issue in gst_issues[:3]:
-                report += f"- {issue}\n"
+        if not gst_issues.empty:
+            parts.append("\n### GST Issues\n")
+            parts.extend(f"- {issue}\n" for issue in gst_issues.head(3))
     else:
-        report += "- No GST-related transactions found\n"
+        parts.append("- No GST-related transactions found\n")
     
     # 4. AI Insights
-    report += "\n## AI Insights\n\n"
+    parts.append("\n## AI Insights\n\n")
     if not df.empty:
+        # value_counts is already sorted descending, so the top vendor is the first entry
         vendor_counts = df['vendor'].value_counts()
         if len(vendor_counts) > 0:
-            main_vendor = vendor_counts.idxmax()
-            report += f"- **Vendor Concentration**: {main_vendor} appears {vendor_counts.max()} times\n"
+            main_vendor, main_vendor_count = vendor_counts.index[0], vendor_counts.iat[0]
+            parts.append(f"- **Vendor Concentration**: {main_vendor} appears {main_vendor_count} times\n")
         
         if expense_ratio > 70:
-            report += f"- **Cost Alert**: High expense ratio ({expense_ratio:.1f}%)\n"
+            parts.append(f"- **Cost Alert**: High expense ratio ({expense_ratio:.1f}%)\n")
     
     # 5. Recommendations
-    report += "\n## Recommendations\n\n"
-    report += "### Immediate Actions\n"
-    if gst_docs:
-        report += "- Reconcile GST input credits\n"
+    parts.append("\n## Recommendations\n\n")
+    parts.append("### Immediate Actions\n")
+    if not gst_df.empty:
+        parts.append("- Reconcile GST input credits\n")
     if risk_flags:
-        report += "- Address compliance flags\n"
+        parts.append("- Address compliance flags\n")
     
-    report += "\n### Strategic Actions\n"
+    parts.append("\n### Strategic Actions\n")
     if profit_margin < 15:
-        report += "- Review pricing strategy\n"
+        parts.append("- Review pricing strategy\n")
     if len(df) > 50:
-        report += "- Consider accounting software for better tracking\n"
+        parts.append("- Consider accounting software for better tracking\n")
     
-    report += f"\n*Report generated on {datetime.now().strftime('%d %b %Y %H:%M')}*"
+    parts.append(f"\n*Report generated on {datetime.now().strftime('%d %b %Y %H:%M')}*")
     
-    return report
+    return ''.join(parts)
 
 def main():
     """Main function that runs the Streamlit app"""
@@ -347,7 +408,7 @@ def main():
     st.title("Professional Audit Report Generator")
     st.markdown("---")
     
-    documents = []
+    df = pd.DataFrame(columns=DOCUMENT_COLUMNS)
     risk_flags = ["Verify all documents for accuracy"]
     
     if input_method == "Upload Documents":
@@ -361,21 +422,14 @@ def main():
         
         if uploaded_files:
             with st.expander("Uploaded Documents Preview", expanded=True):
-                all_docs = []
-                for uploaded_file in uploaded_files:
-                    try:
-                        if uploaded_file.name.lower().endswith('.pdf'):
-                            docs = extract_data_from_pdf(uploaded_file)
-                            all_docs.extend(docs)
-                        elif uploaded_file.name.lower().endswith('.csv'):
-                            docs = extract_data_from_csv(uploaded_file)
-                            all_docs.extend(docs)
-                    except Exception as e:
-                        st.error(f"Error processing {uploaded_file.name}: {e}")
+                all_docs = extract_data_from_uploads(
+                    tuple((f.name, f.getvalue()) for f in uploaded_files),
+                    datetime.now().strftime(DATE_FORMAT)
+                )
                 
                 if all_docs:
-                    documents = all_docs
-                    df = pd.DataFrame([vars(d) for d in all_docs])
+                    # Concatenating differing categories falls back to object, so re-apply dtypes
+                    df = apply_document_dtypes(pd.concat(all_docs, ignore_index=True))
                     st.dataframe(df)
     
     else:  # Manual Entry
@@ -397,20 +451,21 @@ def main():
                 use_container_width=True
             )
             
-            # Convert to Document objects
-            for _, row in edited_df.iterrows():
-                try:
-                    doc = Document(
-                        id=str(row['ID']),
-                        date=str(row['Date']),
-                        vendor=str(row['Vendor']),
-                        amount=float(row['Amount']),
-                        gst=float(row['GST']),
-                        type=str(row['Type']).lower()
-                    )
-                    documents.append(doc)
-                except Exception as e:
-                    st.warning(f"Skipping invalid row: {e}")
+            # Normalise to the shared transaction columns
+            df = edited_df.rename(columns=str.lower)[DOCUMENT_COLUMNS]
+            df = df.assign(
+                id=df['id'].astype(str),
+                date=pd.to_datetime(df['date'].astype(str), format=DATE_FORMAT, errors='coerce'),
+                vendor=df['vendor'].astype(str),
+                amount=pd.to_numeric(df['amount'], errors='coerce'),
+                gst=pd.to_numeric(df['gst'], errors='coerce'),
+                type=df['type'].astype(str).str.lower()
+            )
+            invalid = df[['amount', 'gst']].isna().any(axis=1)
+            if invalid.any():
+                st.warning(f"Skipping {invalid.sum()} invalid row(s)")
+                df = df[~invalid]
+            df = apply_document_dtypes(df)
         
         st.subheader("Compliance Flags")
         risk_flags = st.text_area(
@@ -423,7 +478,7 @@ def main():
     # Generate report section
     st.markdown("---")
     if st.button("✨ Generate Professional Audit Report", use_container_width=True):
-        if not documents:
+        if df.empty:
             st.warning("No transaction data available. Please upload documents or enter data manually.")
             st.stop()
         
@@ -432,7 +487,7 @@ def main():
                 business_name,
                 start_date,
                 end_date,
-                documents,
+                df,
                 risk_flags
             )
             
@@ -441,16 +496,14 @@ def main():
             st.markdown(report, unsafe_allow_html=True)
             
             # Create and offer PDF download
-            pdf_path = create_pdf(report, business_name, start_date, end_date)
-            with open(pdf_path, "rb") as f:
-                st.download_button(
-                    label="📥 Download PDF Report",
-                    data=f,
-                    file_name=f"{business_name}_Audit_Report_{start_date}_to_{end_date}.pdf",
-                    mime="application/pdf",
-                    use_container_width=True
-                )
-            os.unlink(pdf_path)
+            pdf_bytes = create_pdf(report, business_name, start_date, end_date)
+            st.download_button(
+                label="📥 Download PDF Report",
+                data=pdf_bytes,
+                file_name=f"{business_name}_Audit_Report_{start_date}_to_{end_date}.pdf",
+                mime="application/pdf",
+                use_container_width=True
+            )
 
 if __name__ == "__main__":
     main()
\ No newline at end of file